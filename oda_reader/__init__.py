@@ -10,6 +10,11 @@ from oda_reader.dac1 import download_dac1
 from oda_reader.dac2a import download_dac2a
 from oda_reader.multisystem import download_multisystem, bulk_download_multisystem
 from oda_reader.crs import download_crs, bulk_download_crs, download_crs_file
+from oda_reader.download.download_tools import (
+    bulk_download_parquet,
+    bulk_download_parquet_many,
+    iter_bulk_download_parquet,
+)
 from oda_reader.tools import get_available_filters
 
 
@@ -22,5 +27,8 @@ __all__ = [
     "download_crs",
     "bulk_download_crs",
     "download_crs_file",
+    "bulk_download_parquet",
+    "bulk_download_parquet_many",
+    "iter_bulk_download_parquet",
     "get_available_filters",
 ]
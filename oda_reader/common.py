@@ -1,14 +1,66 @@
+import json
 import logging
-from copy import deepcopy
-from io import StringIO
+from io import BytesIO, StringIO
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
 import requests
+from pyarrow import csv as pa_csv
 
-logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+try:
+    import orjson
+except ImportError:  # orjson is optional. The standard library is used instead.
+    orjson = None
 
+# Logging is configured by the application. The library only adds a NullHandler.
 logger = logging.getLogger("oda_importer")
+logger.addHandler(logging.NullHandler())
+
+# Columns which can contain non-numeric codes, even if the schema expects numbers
+STRING_CODE_COLUMNS = ("CHANNEL", "MODALITY", "MD_DIM")
+
+# The values which `pd.read_csv` treats as missing by default, for pyarrow's reader
+PANDAS_NA_VALUES = (
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+)
+
+# Dataflows which (as found at runtime) must be requested from the dcd-public host
+_DCD_PUBLIC_DATAFLOWS: set[str] = set()
+
+
+def read_json(path: str | Path):
+    """Read a JSON file, using orjson if it is installed.
+
+    Args:
+        path (str | Path): The path to the JSON file.
+
+    Returns:
+        The contents of the file.
+    """
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+
+    with open(path, "r") as f:
+        return json.load(f)
 
 
 class ImporterPaths:
@@ -34,6 +86,12 @@ def text_to_stringIO(response: requests.models.Response) -> StringIO:
     return StringIO(response.text)
 
 
+def _dataflow_from_url(url: str) -> str:
+    """Get the part of a query URL which identifies the dataflow (the URL without the
+    query parameters and the filter)."""
+    return url.split("?")[0].rsplit("/", 1)[0]
+
+
 def get_data_from_api(url: str, compressed: bool = True) -> requests.models.Response:
     """Download a CSV file from an API endpoint and return it as a DataFrame.
 
@@ -51,6 +109,11 @@ def get_data_from_api(url: str, compressed: bool = True) -> requests.models.Resp
     else:
         headers = {}
 
+    # If this dataflow is known to be served from dcd-public, go there directly
+    dataflow = _dataflow_from_url(url)
+    if dataflow in _DCD_PUBLIC_DATAFLOWS:
+        url = url.replace("public", "dcd-public")
+
     # Fetch the data with headers
     logger.info(f"Fetching data from {url}")
     response = requests.get(url, headers=headers)
@@ -58,16 +121,111 @@ def get_data_from_api(url: str, compressed: bool = True) -> requests.models.Resp
     if (response.status_code == 404) and (response.text == "NoRecordsFound"):
         raise ConnectionError("No data found for the selected parameters.")
 
-    if (response.status_code == 500) and (response.text.find("not set to") > 0):
+    if (
+        (response.status_code == 500)
+        and (response.text.find("not set to") > 0)
+        and ("dcd-public" not in url)
+    ):
         url = url.replace("public", "dcd-public")
         response = requests.get(url, headers=headers)
 
+        # Remember the host, to avoid the failed request next time
+        if response.ok:
+            _DCD_PUBLIC_DATAFLOWS.add(dataflow)
+
     # Ensure the request was successful
     response.raise_for_status()
 
     return response
 
 
+def _with_string_code_columns(read_csv_options: dict) -> dict:
+    """Return a copy of the read_csv options where the columns which can contain
+    non-numeric codes (like "_T" in aggregates) are read as strings.
+
+    Args:
+        read_csv_options (dict): Options to pass to `pd.read_csv`.
+
+    Returns:
+        dict: A copy of the options, with updated data types.
+    """
+    dtype = dict(read_csv_options.get("dtype", {}))
+    dtype.update({column: "string[pyarrow]" for column in STRING_CODE_COLUMNS})
+
+    return {**read_csv_options, "dtype": dtype}
+
+
+def _to_arrow_type(dtype) -> pa.DataType:
+    """Convert a pandas data type (like "int32[pyarrow]") to a pyarrow data type."""
+    dtype = pd.api.types.pandas_dtype(dtype)
+
+    if isinstance(dtype, pd.ArrowDtype):
+        return dtype.pyarrow_dtype
+    if isinstance(dtype, pd.StringDtype):
+        return pa.string()
+
+    return pa.from_numpy_dtype(dtype)
+
+
+def _to_pandas_type(arrow_type: pa.DataType) -> pd.api.extensions.ExtensionDtype:
+    """Convert a pyarrow data type to the pyarrow-backed pandas data type used by
+    the schemas (strings are read as "string[pyarrow]")."""
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.StringDtype("pyarrow")
+
+    return pd.ArrowDtype(arrow_type)
+
+
+def _read_csv_with_pyarrow(content: bytes, read_csv_options: dict) -> pd.DataFrame:
+    """Read CSV content into a DataFrame using pyarrow's CSV reader.
+
+    Columns which pyarrow would read as dates or times are read as text, as
+    `pd.read_csv` does.
+
+    Args:
+        content (bytes): The CSV content.
+        read_csv_options (dict): Options which would be passed to `pd.read_csv`. The
+        data types and NA values are translated to their pyarrow equivalents.
+
+    Returns:
+        pd.DataFrame: The data as a DataFrame, with pyarrow-backed data types.
+
+    """
+    # Translate the NA values. Like pandas, keep the default ones unless told not to.
+    null_values = list(read_csv_options.get("na_values", ()))
+    if read_csv_options.get("keep_default_na", True):
+        null_values += PANDAS_NA_VALUES
+
+    column_types = {
+        column: _to_arrow_type(dtype)
+        for column, dtype in read_csv_options.get("dtype", {}).items()
+    }
+
+    while True:
+        convert_options = pa_csv.ConvertOptions(
+            column_types=column_types,
+            null_values=null_values,
+            strings_can_be_null=True,
+        )
+        table = pa_csv.read_csv(
+            pa.BufferReader(content), convert_options=convert_options
+        )
+
+        # Like pandas, read any columns inferred as dates or times again as text
+        temporal = {
+            field.name: pa.string()
+            for field in table.schema
+            if pa.types.is_temporal(field.type)
+        }
+        if not temporal:
+            break
+        column_types |= temporal
+
+    return table.to_pandas(
+        types_mapper=_to_pandas_type, split_blocks=True, self_destruct=True
+    )
+
+
 def api_response_to_df(
     url: str, read_csv_options: dict = None, compressed: bool = True
 ) -> pd.DataFrame:
@@ -93,15 +251,23 @@ def api_response_to_df(
     # Fetch the data from the API with compression headers
     response = get_data_from_api(url=url, compressed=compressed)
 
-    # Convert the content to stringIO
-    data = text_to_stringIO(response)
+    # Parse the data with pyarrow's (multithreaded) CSV reader. Some responses contain
+    # non-numeric codes in numeric columns, in which case those are read as strings.
+    for options in (read_csv_options, _with_string_code_columns(read_csv_options)):
+        try:
+            return _read_csv_with_pyarrow(response.content, options)
+        except pa.ArrowInvalid:
+            continue
+
+    logger.debug("Could not parse the data with pyarrow. Falling back to pandas.")
+
+    # Wrap the (already decompressed) bytes, without decoding them to text first
+    data = BytesIO(response.content)
 
     # Return the data as a DataFrame
     try:
-        d_ = deepcopy(data)
-        return pd.read_csv(d_, **read_csv_options)
-    except ValueError:
-        read_csv_options["dtype"]["CHANNEL"] = "string[pyarrow]"
-        read_csv_options["dtype"]["MODALITY"] = "string[pyarrow]"
-        read_csv_options["dtype"]["MD_DIM"] = "string[pyarrow]"
         return pd.read_csv(data, **read_csv_options)
+    except ValueError:
+        # Rewind the buffer and retry, reading the code columns as strings
+        data.seek(0)
+        return pd.read_csv(data, **_with_string_code_columns(read_csv_options))
@@ -14,6 +14,12 @@ DATAFLOW_ID: str = "DSD_CRS@DF_CRS"
 DATAFLOW_ID_GE: str = "DSD_GREQ@DF_CRS_GREQ"
 DATAFLOW_VERSION: str = "1.1"
 
+# Dimensions which must be set to "_T" to avoid duplicates when requesting aggregates
+AGGREGATE_DIMENSIONS: tuple[str, ...] = ("channel", "modality")
+AGGREGATE_WARNING: str = (
+    "Unless you specify {dimension}: '_T', the data will contain duplicates."
+)
+
 """
 {donor}.{recipient}.{sector}.{measure}.{channel}.
         {modality}.{flow_type}.{price_base}.{md_dim}.{md_id}.{unit_measure}.
@@ -35,7 +41,11 @@ def get_year_crs_zip_id(year: int):
     )
 
 
-def download_crs_file(year: int | str, save_to_path: Path | str | None = None):
+def download_crs_file(
+    year: int | str,
+    save_to_path: Path | str | None = None,
+    columns: list[str] | None = None,
+):
     """
     Download a year of CRS data from the bulk download service. The file is large.
     It is therefore strongly recommended to save it to disk. If save_to_path is not
@@ -45,6 +55,8 @@ def download_crs_file(year: int | str, save_to_path: Path | str | None = None):
         year: The year of CRS data to download.
         save_to_path: The path to save the file to. Optional. If not provided, a
         DataFrame is returned.
+        columns: The columns to read. Optional. If not provided, all columns are
+        read. Only used when a DataFrame is returned.
 
     Returns:
         pd.DataFrame | None: The DataFrame if save_to_path is not provided.
@@ -54,12 +66,14 @@ def download_crs_file(year: int | str, save_to_path: Path | str | None = None):
     file_id = get_year_crs_zip_id(year=year)
 
     return bulk_download_parquet(
-        file_id=file_id, save_to_path=save_to_path, is_txt=True
+        file_id=file_id, save_to_path=save_to_path, is_txt=True, columns=columns
     )
 
 
 def bulk_download_crs(
-    save_to_path: Path | str | None = None, reduced_version: bool = False
+    save_to_path: Path | str | None = None,
+    reduced_version: bool = False,
+    columns: list[str] | None = None,
 ):
     """
     Bulk download the CRS data from the bulk download service. The file is very large.
@@ -70,6 +84,8 @@ def bulk_download_crs(
         save_to_path: The path to save the file to. Optional. If not provided, a
         DataFrame is returned.
         reduced_version: Whether to download the reduced version of the CRS data.
+        columns: The columns to read. Optional. If not provided, all columns are
+        read. Only used when a DataFrame is returned.
 
     Returns:
         pd.DataFrame | None: The DataFrame if save_to_path is not provided.
@@ -81,7 +97,9 @@ def bulk_download_crs(
     else:
         file_id = get_full_crs_parquet_id()
 
-    return bulk_download_parquet(file_id=file_id, save_to_path=save_to_path)
+    return bulk_download_parquet(
+        file_id=file_id, save_to_path=save_to_path, columns=columns
+    )
 
 
 def download_crs(
@@ -119,16 +137,17 @@ def download_crs(
         "the full dataset instead."
     )
 
+    if not filters:
+        filters = {}
+
     # Warn about duplicates
     if filters.get("microdata") is False:
         warning_message = "\nYou have requested aggregates.\n"
-        warnings = [w for w in ("channel", "modality") if w not in filters]
-
-        if warnings:
-            warning_message += "\n".join(
-                f"Unless you specify {w}: '_T', the data will contain duplicates."
-                for w in warnings
-            )
+        warning_message += "\n".join(
+            AGGREGATE_WARNING.format(dimension=dimension)
+            for dimension in AGGREGATE_DIMENSIONS
+            if dimension not in filters
+        )
 
         logger.warning(warning_message)
 
@@ -1,12 +1,28 @@
-import io
-import re
+import os
+import shutil
+import tempfile
+import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from pathlib import Path
+from types import MappingProxyType
+from typing import IO, Callable, Iterator
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import requests
+from pyarrow import csv as pa_csv
 
-from oda_reader.common import api_response_to_df, logger
+from oda_reader.common import (
+    PANDAS_NA_VALUES,
+    STRING_CODE_COLUMNS,
+    api_response_to_df,
+    logger,
+)
 from oda_reader.download.query_builder import QueryBuilder
 from oda_reader.schemas.crs_translation import convert_crs_to_dotstat_codes
 from oda_reader.schemas.dac1_translation import convert_dac1_to_dotstat_codes
@@ -28,6 +44,307 @@ MULTI_FLOW_URL = BASE_DATAFLOW + "DSD_MULTI@DF_MULTI/"
 FALLBACK_STEP = 0.1
 MAX_RETRIES = 5
 
+# Large year ranges are downloaded in windows of this many years, concurrently
+YEAR_WINDOW = 5
+MAX_WORKERS = 4
+
+# Bulk files are copied to disk in blocks of this size
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+OECD_TXT_ARGS = {
+    "delimiter": "|",
+    "encoding": "utf-8",
+    "quotechar": '"',
+    "low_memory": False,
+}
+
+# The same options, for pyarrow's (multithreaded) CSV reader
+TXT_READ_OPTIONS = pa_csv.ReadOptions(
+    use_threads=True, block_size=8 << 20, encoding="utf-8"
+)
+TXT_PARSE_OPTIONS = pa_csv.ParseOptions(delimiter="|", quote_char='"')
+
+# Characters replaced in the names of the files saved from bulk archives
+_FILE_NAME_TABLE = str.maketrans({" ": "_"})
+
+# Options used when the .txt bulk files are saved as parquet
+PARQUET_WRITE_ARGS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+}
+
+
+# The filter builder and code conversion function for each version
+VERSION_FUNCTIONS = {
+    "dac1": {
+        "filter_builder": QueryBuilder.build_dac1_filter,
+        "convert_func": convert_dac1_to_dotstat_codes,
+    },
+    "dac2a": {
+        "filter_builder": QueryBuilder.build_dac2a_filter,
+        "convert_func": convert_dac2a_to_dotstat_codes,
+    },
+    "multisystem": {
+        "filter_builder": QueryBuilder.build_multisystem_filter,
+        "convert_func": convert_multisystem_to_dotstat_codes,
+    },
+    "crs": {
+        "filter_builder": QueryBuilder.build_crs_filter,
+        "convert_func": convert_crs_to_dotstat_codes,
+    },
+}
+
+
+@lru_cache
+def _read_csv_options(version: str) -> MappingProxyType:
+    """Get the options to read the API response for a version. These are only built
+    once per version.
+
+    Args:
+        version (str): The version of the data (e.g. "dac1").
+
+    Returns:
+        MappingProxyType: The options to pass to `pd.read_csv` (read-only).
+    """
+    # Get a data types dictionary
+    data_types = get_dtypes(schema=read_schema_translation(version=version))
+
+    return MappingProxyType(
+        {
+            "na_values": ("_Z", "nan"),
+            "keep_default_na": True,
+            "dtype": data_types,
+            "dtype_backend": "pyarrow",
+        }
+    )
+
+
+def _build_url(
+    filter_builder: Callable[..., str],
+    dataflow_id: str,
+    dataflow_version: str | None,
+    start_year: int | None,
+    end_year: int | None,
+    filters: dict | None,
+) -> str:
+    """Build the API query URL for a given set of download arguments.
+
+    Args:
+        filter_builder (Callable): The QueryBuilder method used to build the filter.
+        dataflow_id (str): The dataflow id of the data to download.
+        dataflow_version (str | None): The version of the dataflow.
+        start_year (int | None): The start year of the data to download.
+        end_year (int | None): The end year of the data to download.
+        filters (dict | None): The filters to apply to the data. Optional.
+
+    Returns:
+        str: The query URL.
+    """
+    # instantiate the query builder
+    qb = QueryBuilder(dataflow_id=dataflow_id, dataflow_version=dataflow_version)
+
+    # Optionally set filters
+    if isinstance(filters, dict):
+        qb.set_filter(filter_builder(qb, **filters))
+
+    return qb.set_time_period(start=start_year, end=end_year).build_query()
+
+
+def _filters_to_key(filters: dict | None) -> tuple | None:
+    """Convert a filters dictionary into a hashable (and order independent) key.
+
+    Args:
+        filters (dict | None): The filters, as passed to `download`.
+
+    Returns:
+        tuple | None: The filters as a sorted tuple of (key, value) pairs. Lists, sets
+        and arrays of values are converted to sorted tuples. None if no filters
+        dictionary is provided.
+
+    Raises:
+        TypeError: If a value cannot be converted (e.g. its items cannot be sorted).
+    """
+    if not isinstance(filters, dict):
+        return None
+
+    def _to_key(value):
+        # Single values are used as they are
+        if value is None or isinstance(value, (str, int, float)):
+            return value
+        return tuple(sorted(value))
+
+    key = tuple(sorted((name, _to_key(value)) for name, value in filters.items()))
+
+    # Make sure the key can be cached
+    hash(key)
+
+    return key
+
+
+@lru_cache(maxsize=128)
+def _build_cached_url(
+    filter_builder: Callable[..., str],
+    dataflow_id: str,
+    dataflow_version: str | None,
+    start_year: int | None,
+    end_year: int | None,
+    filters_key: tuple | None,
+) -> str:
+    """Build (and memoize) the API query URL for a given set of download arguments.
+
+    Args:
+        filter_builder (Callable): The QueryBuilder method used to build the filter.
+        dataflow_id (str): The dataflow id of the data to download.
+        dataflow_version (str | None): The version of the dataflow.
+        start_year (int | None): The start year of the data to download.
+        end_year (int | None): The end year of the data to download.
+        filters_key (tuple | None): The filters, as returned by `_filters_to_key`.
+
+    Returns:
+        str: The query URL.
+    """
+    filters = None
+    if filters_key is not None:
+        filters = {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in filters_key
+        }
+
+    return _build_url(
+        filter_builder=filter_builder,
+        dataflow_id=dataflow_id,
+        dataflow_version=dataflow_version,
+        start_year=start_year,
+        end_year=end_year,
+        filters=filters,
+    )
+
+
+def _get_url(
+    filter_builder: Callable[..., str],
+    dataflow_id: str,
+    dataflow_version: str | None,
+    start_year: int | None,
+    end_year: int | None,
+    filters: dict | None,
+) -> str:
+    """Get the API query URL for a given set of download arguments. URLs are cached
+    when the filters can be converted to a hashable key, and built every time
+    otherwise.
+
+    Args:
+        filter_builder (Callable): The QueryBuilder method used to build the filter.
+        dataflow_id (str): The dataflow id of the data to download.
+        dataflow_version (str | None): The version of the dataflow.
+        start_year (int | None): The start year of the data to download.
+        end_year (int | None): The end year of the data to download.
+        filters (dict | None): The filters to apply to the data. Optional.
+
+    Returns:
+        str: The query URL.
+    """
+    arguments = {
+        "filter_builder": filter_builder,
+        "dataflow_id": dataflow_id,
+        "dataflow_version": dataflow_version,
+        "start_year": start_year,
+        "end_year": end_year,
+    }
+
+    try:
+        filters_key = _filters_to_key(filters)
+    except TypeError:
+        logger.debug("The filters cannot be cached. Building the URL.")
+        return _build_url(**arguments, filters=filters)
+
+    return _build_cached_url(**arguments, filters_key=filters_key)
+
+
+def _year_windows(
+    start_year: int | None, end_year: int | None
+) -> list[tuple[int | None, int | None]]:
+    """Split a range of years into windows of (at most) YEAR_WINDOW years.
+
+    Args:
+        start_year (int | None): The start year of the data to download.
+        end_year (int | None): The end year of the data to download.
+
+    Returns:
+        list[tuple[int | None, int | None]]: The (start, end) year of each window. If
+        either year is not provided, or the range is small, a single window is returned.
+    """
+    if start_year is None or end_year is None:
+        return [(start_year, end_year)]
+
+    if end_year - start_year + 1 <= YEAR_WINDOW:
+        return [(start_year, end_year)]
+
+    return [
+        (window_start, min(window_start + YEAR_WINDOW - 1, end_year))
+        for window_start in range(start_year, end_year + 1, YEAR_WINDOW)
+    ]
+
+
+def _download_window(url: str, read_csv_options: dict) -> pd.DataFrame | None:
+    """Download the data for a single window of years.
+
+    Args:
+        url (str): The query URL for the window.
+        read_csv_options (dict): Options to pass to `pd.read_csv`.
+
+    Returns:
+        pd.DataFrame | None: The data, or None if there is no data for the window.
+    """
+    try:
+        return api_response_to_df(url=url, read_csv_options=read_csv_options)
+    except ConnectionError:
+        logger.info(f"No data found for {url}")
+        return None
+
+
+def _download_windows(urls: list[str], read_csv_options: dict) -> pd.DataFrame:
+    """Download the data for several windows of years concurrently, and combine it.
+
+    Args:
+        urls (list[str]): The query URL for each window.
+        read_csv_options (dict): Options to pass to `pd.read_csv`.
+
+    Returns:
+        pd.DataFrame: The combined data.
+    """
+    logger.info(f"Downloading the data in {len(urls)} parts.")
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(urls))) as executor:
+        frames = [
+            frame
+            for frame in executor.map(
+                lambda url: _download_window(url, read_csv_options), urls
+            )
+            if frame is not None
+        ]
+
+    if not frames:
+        raise ConnectionError("No data found for the selected parameters.")
+
+    # If the code columns were read as text for any window, read them as text for all
+    # of them, so that the combined columns do not mix strings and numbers
+    text_columns = {
+        column
+        for frame in frames
+        for column in STRING_CODE_COLUMNS
+        if column in frame.columns and not pd.api.types.is_numeric_dtype(frame[column])
+    }
+    if text_columns:
+        frames = [
+            frame.astype(
+                {c: "string[pyarrow]" for c in text_columns if c in frame.columns}
+            )
+            for frame in frames
+        ]
+
+    return pd.concat(frames, ignore_index=True)
+
 
 def download(
     version: str,
@@ -60,57 +377,35 @@ def download(
     # Load the translation schema from .stat  to the new explorer
     schema_translation = read_schema_translation(version=version)
 
-    # Get a data types dictionary
-    data_types = get_dtypes(schema=schema_translation)
-
-    # Set read csv options
-    df_options = {
-        "na_values": ("_Z", "nan"),
-        "keep_default_na": True,
-        "dtype": data_types,
-    }
-
-    # instantiate the query builder
-    qb = QueryBuilder(dataflow_id=dataflow_id, dataflow_version=dataflow_version)
-
-    # Define the version functions
-    version_functions = {
-        "dac1": {
-            "filter_builder": qb.build_dac1_filter,
-            "convert_func": convert_dac1_to_dotstat_codes,
-        },
-        "dac2a": {
-            "filter_builder": qb.build_dac2a_filter,
-            "convert_func": convert_dac2a_to_dotstat_codes,
-        },
-        "multisystem": {
-            "filter_builder": qb.build_multisystem_filter,
-            "convert_func": convert_multisystem_to_dotstat_codes,
-        },
-        "crs": {
-            "filter_builder": qb.build_crs_filter,
-            "convert_func": convert_crs_to_dotstat_codes,
-        },
-    }
-
     try:
-        filter_builder = version_functions[version]["filter_builder"]
-        convert_func = version_functions[version]["convert_func"]
+        filter_builder = VERSION_FUNCTIONS[version]["filter_builder"]
+        convert_func = VERSION_FUNCTIONS[version]["convert_func"]
     except KeyError:
         raise ValueError(
-            f"Version must be one of {', '.join(list(version_functions))}."
+            f"Version must be one of {', '.join(list(VERSION_FUNCTIONS))}."
         )
 
-    # Optionally set filters
-    if isinstance(filters, dict):
-        filter_str = filter_builder(**filters)
-        qb.set_filter(filter_str)
+    # Get the read csv options (built once per version)
+    df_options = _read_csv_options(version)
 
-    # Get the url
-    url = qb.set_time_period(start=start_year, end=end_year).build_query()
+    # Get the url (one per window of years)
+    urls = [
+        _get_url(
+            filter_builder=filter_builder,
+            dataflow_id=dataflow_id,
+            dataflow_version=dataflow_version,
+            start_year=window_start,
+            end_year=window_end,
+            filters=filters,
+        )
+        for window_start, window_end in _year_windows(start_year, end_year)
+    ]
 
     # Get the dataframe
-    df = api_response_to_df(url=url, read_csv_options=df_options)
+    if len(urls) == 1:
+        df = api_response_to_df(url=urls[0], read_csv_options=df_options)
+    else:
+        df = _download_windows(urls=urls, read_csv_options=df_options)
 
     # Preprocess the data
     if pre_process:
@@ -127,6 +422,355 @@ def download(
     return df
 
 
+@contextmanager
+def _open_zip(response: requests.Response) -> Iterator[zipfile.ZipFile]:
+    """Open the (streamed) content of a response as a zip archive.
+
+    The content is written to a temporary file on disk. The zip archive then reads
+    only the members it needs, instead of keeping the whole payload in memory.
+
+    Args:
+        response (requests.Response): The response object, requested with stream=True.
+
+    Yields:
+        zipfile.ZipFile: The zip archive.
+    """
+    # Let urllib3 undo any content encoding (e.g. gzip) while the body is copied
+    response.raw.decode_content = True
+
+    # A plain temporary file is used, since SpooledTemporaryFile is not seekable
+    # by zipfile on Python 3.10
+    with tempfile.TemporaryFile() as tmp:
+        shutil.copyfileobj(response.raw, tmp, DOWNLOAD_CHUNK_SIZE)
+
+        tmp.seek(0)
+        with zipfile.ZipFile(tmp) as z:
+            yield z
+
+
+@contextmanager
+def _atomic_path(path: Path) -> Iterator[Path]:
+    """Yield a temporary path to write to, which replaces `path` once the block
+    completes. If writing fails, the temporary file is removed instead, so a partially
+    written file is never left at `path`.
+
+    Args:
+        path (Path): The final path of the file.
+
+    Yields:
+        Path: The temporary path (in the same folder) to write the file to.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}-{uuid.uuid4().hex}.tmp")
+
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_txt_table(
+    open_file: Callable[[], IO[bytes]], columns: list[str] | None = None
+) -> pa.Table:
+    """Read an OECD .txt file with pyarrow's (multithreaded) CSV reader.
+
+    The data types are inferred as `pd.read_csv` would: columns which pyarrow reads as
+    dates or times are read again as text, empty values are read as missing, and empty
+    columns are read as floats. If pyarrow cannot parse the file, it is read with
+    pandas instead.
+
+    Args:
+        open_file (Callable[[], IO[bytes]]): A function which opens the file, so that
+        it can be read more than once.
+        columns (list[str] | None): The columns to read. Optional. If not provided,
+        all columns are read.
+
+    Returns:
+        pa.Table: The contents of the file.
+    """
+    column_types = {}
+
+    try:
+        while True:
+            convert_options = pa_csv.ConvertOptions(
+                column_types=column_types,
+                include_columns=columns or [],
+                null_values=PANDAS_NA_VALUES,
+                strings_can_be_null=True,
+            )
+            with open_file() as f_in:
+                table = pa_csv.read_csv(
+                    f_in,
+                    read_options=TXT_READ_OPTIONS,
+                    parse_options=TXT_PARSE_OPTIONS,
+                    convert_options=convert_options,
+                )
+
+            # If any columns were read as dates or times, read them again as text
+            temporal = {
+                field.name: pa.string()
+                for field in table.schema
+                if pa.types.is_temporal(field.type)
+            }
+            if not temporal:
+                break
+            column_types |= temporal
+
+    except pa.ArrowInvalid:
+        logger.debug("Could not parse the file with pyarrow. Falling back to pandas.")
+        with open_file() as f_in:
+            df = pd.read_csv(f_in, usecols=columns, **OECD_TXT_ARGS)
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    # Columns without any values are read as floats (NaN)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+
+    return table
+
+
+def _filter_txt_table(
+    table: pa.Table, filters: list, columns: list[str] | None = None
+) -> pa.Table:
+    """Keep the rows of a table which match the filters, and the requested columns.
+
+    Args:
+        table (pa.Table): The table to filter.
+        filters (list): Row filters, in the `pyarrow.parquet` format.
+        columns (list[str] | None): The columns to keep. Optional. If not provided,
+        all columns are kept.
+
+    Returns:
+        pa.Table: The filtered table.
+    """
+    table = table.filter(pq.filters_to_expression(filters))
+
+    return table.select(columns) if columns else table
+
+
+def _filter_columns(filters: list) -> list[str]:
+    """Get the columns used by row filters in the `pyarrow.parquet` format. These are
+    either a list of (column, op, value) tuples, or a list of lists of them.
+
+    Args:
+        filters (list): The row filters.
+
+    Returns:
+        list[str]: The columns used by the filters.
+    """
+    conditions = [
+        condition
+        for group in filters
+        for condition in (group if isinstance(group, list) else [group])
+    ]
+
+    return [column for column, _, _ in conditions]
+
+
+def _read_parquet_table(
+    path: str, columns: list[str] | None = None, filters: list | None = None
+) -> pa.Table:
+    """Read a parquet file, decoding (only the requested) column chunks in parallel and
+    coalescing reads. Row groups whose statistics don't match the filters are skipped.
+
+    Args:
+        path (str): The path to the parquet file.
+        columns (list[str] | None): The columns to read. Optional. If not provided,
+        all columns are read.
+        filters (list | None): Row filters, in the `pyarrow.parquet` format. Optional.
+
+    Returns:
+        pa.Table: The contents of the file.
+    """
+    return pq.read_table(
+        path, columns=columns, filters=filters, use_threads=True, pre_buffer=True
+    )
+
+
+def _iter_tables(
+    response: requests.Response,
+    is_txt: bool = False,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+    batch_size: int | None = None,
+) -> Iterator[pa.Table]:
+    """Yield the files contained in a zip archive in the response content, one
+    pyarrow Table at a time.
+
+    Args:
+        response (requests.Response): The response object.
+        is_txt (bool): Whether the archive contains .txt files (instead of parquet).
+        columns (list[str] | None): The columns to read. Optional. If not provided,
+        all columns are read.
+        filters (list | None): Row filters, in the `pyarrow.parquet` format (e.g.
+        `[("Year", ">=", 2020)]`). Optional. Row groups which can't match are skipped.
+        batch_size (int | None): The maximum number of rows per yielded item.
+        Optional. If not provided, each file is yielded whole.
+
+    Yields:
+        pa.Table: One Table per file in the archive (or per batch of rows).
+    """
+    extension = ".txt" if is_txt else ".parquet"
+
+    # Open the content as a zip file and read the files one by one
+    with _open_zip(response) as z:
+        # Find all matching files in the zip archive
+        files = [name for name in z.namelist() if name.endswith(extension)]
+
+        logger.info(f"Reading {len(files)} files.")
+
+        # Text files have no statistics, so any filter columns must be read as well
+        txt_columns = columns
+        if columns and filters:
+            txt_columns = list(dict.fromkeys(columns + _filter_columns(filters)))
+
+        for file_name in files:
+            if is_txt:
+                table = _read_txt_table(partial(z.open, file_name), columns=txt_columns)
+                if filters:
+                    table = _filter_txt_table(table, filters, columns)
+
+                # Text files are read whole, but can still be yielded in batches
+                if not batch_size:
+                    yield table
+                    continue
+                for offset in range(0, table.num_rows, batch_size):
+                    yield table.slice(offset, batch_size)
+                continue
+
+            # Compressed zip members can't be read at random, so extract the file first
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = z.extract(file_name, tmp_dir)
+
+                # Stream the file in batches, so that only part of it is in memory
+                if batch_size:
+                    batches = ds.dataset(path, format="parquet").to_batches(
+                        columns=columns,
+                        filter=pq.filters_to_expression(filters) if filters else None,
+                        batch_size=batch_size,
+                    )
+                    for batch in batches:
+                        yield pa.Table.from_batches([batch])
+                    continue
+
+                yield _read_parquet_table(path, columns=columns, filters=filters)
+
+
+def _read_tables(
+    response: requests.Response,
+    is_txt: bool = False,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+) -> list[pa.Table]:
+    """Read all the files contained in a zip archive in the response content. Parquet
+    files are extracted and read concurrently.
+
+    Args:
+        response (requests.Response): The response object.
+        is_txt (bool): Whether the archive contains .txt files (instead of parquet).
+        columns (list[str] | None): The columns to read. Optional. If not provided,
+        all columns are read.
+        filters (list | None): Row filters, in the `pyarrow.parquet` format (e.g.
+        `[("Year", ">=", 2020)]`). Optional. Row groups which can't match are skipped.
+
+    Returns:
+        list[pa.Table]: One Table per file in the archive.
+    """
+    # Text files are parsed by a multithreaded reader already, one at a time
+    if is_txt:
+        return list(
+            _iter_tables(response, is_txt=True, columns=columns, filters=filters)
+        )
+
+    with _open_zip(response) as z, tempfile.TemporaryDirectory() as tmp_dir:
+        # Find all parquet files in the zip archive
+        files = [name for name in z.namelist() if name.endswith(".parquet")]
+
+        logger.info(f"Reading {len(files)} files.")
+
+        def _read_one(file_name: str) -> pa.Table:
+            # Each file gets its own folder, so no folders are created concurrently
+            path = z.extract(file_name, tempfile.mkdtemp(dir=tmp_dir))
+            return _read_parquet_table(path, columns=columns, filters=filters)
+
+        # Inflating and decoding release the GIL, so the files are read concurrently
+        workers = max(1, min(MAX_WORKERS, len(files)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_read_one, files))
+
+
+def _iter_frames(
+    response: requests.Response,
+    is_txt: bool = False,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+    batch_size: int | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield the files contained in a zip archive in the response content, one
+    DataFrame at a time.
+
+    Args:
+        response (requests.Response): The response object.
+        is_txt (bool): Whether the archive contains .txt files (instead of parquet).
+        columns (list[str] | None): The columns to read. Optional. If not provided,
+        all columns are read.
+        filters (list | None): Row filters, in the `pyarrow.parquet` format (e.g.
+        `[("Year", ">=", 2020)]`). Optional. Row groups which can't match are skipped.
+        batch_size (int | None): The maximum number of rows per yielded item.
+        Optional. If not provided, each file is yielded whole.
+
+    Yields:
+        pd.DataFrame: One DataFrame per file in the archive (or per batch of rows).
+    """
+    for table in _iter_tables(
+        response,
+        is_txt=is_txt,
+        columns=columns,
+        filters=filters,
+        batch_size=batch_size,
+    ):
+        yield table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _tables_to_df(tables: list[pa.Table]) -> pd.DataFrame:
+    """Combine several pyarrow Tables into a single DataFrame.
+
+    The tables are concatenated before being converted, so the data is only copied
+    once. If their schemas can't be reconciled, they are combined with pandas instead.
+
+    Args:
+        tables (list[pa.Table]): The tables to combine.
+
+    Returns:
+        pd.DataFrame: The combined DataFrame.
+    """
+    try:
+        table = pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pd.concat([table.to_pandas() for table in tables], ignore_index=True)
+
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _clean_name(file_name: str) -> str:
+    """Get the name a text file from a bulk archive is saved under, as parquet.
+
+    Args:
+        file_name (str): The name of the file in the archive.
+
+    Returns:
+        str: The lowercase name, with underscores instead of spaces and a .parquet
+        extension.
+    """
+    stem, extension = os.path.splitext(file_name)
+    if extension in (".txt", ".csv"):
+        extension = ".parquet"
+
+    return f"{stem}{extension}".lower().translate(_FILE_NAME_TABLE)
+
+
 def _save_or_return_parquet_files_from_content(
     response: requests.Response,
     save_to_path: Path | str | None = None,
@@ -142,28 +786,31 @@ def _save_or_return_parquet_files_from_content(
         list[pd.DataFrame]: The extracted DataFrames if save_to_path is not provided.
     """
 
+    # If save_to_path is not provided, return the DataFrames
+    if not save_to_path:
+        return list(_iter_frames(response))
+
     # Convert the save_to_path to a Path object
-    save_to_path = Path(save_to_path) if save_to_path else None
+    save_to_path = Path(save_to_path)
 
     # Open the content as a zip file and extract the parquet files
-    with zipfile.ZipFile(io.BytesIO(response.content)) as z:
+    with _open_zip(response) as z:
         # Find all parquet files in the zip archive
         parquet_files = [name for name in z.namelist() if name.endswith(".parquet")]
 
-        # If save_to_path is provided, save the files to the path
-        if save_to_path:
-            save_to_path.mkdir(parents=True, exist_ok=True)
-            for file_name in parquet_files:
-                logger.info(f"Saving {file_name}")
-                with z.open(file_name) as f_in, (save_to_path / file_name).open(
-                    "wb"
-                ) as f_out:
-                    f_out.write(f_in.read())
-            return
+        def _save_one(file_name: str) -> None:
+            logger.info(f"Saving {file_name}")
+            with _atomic_path(save_to_path / file_name) as tmp_path, z.open(
+                file_name
+            ) as f_in, tmp_path.open("wb") as f_out:
+                shutil.copyfileobj(f_in, f_out, DOWNLOAD_CHUNK_SIZE)
 
-        # If save_to_path is not provided, return the DataFrames
-        logger.info(f"Reading {len(parquet_files)} parquet files.")
-        return [pd.read_parquet(z.open(file)) for file in parquet_files]
+        # Save the files to the path. Inflating releases the GIL, so the files are
+        # extracted concurrently.
+        save_to_path.mkdir(parents=True, exist_ok=True)
+        workers = max(1, min(MAX_WORKERS, len(parquet_files)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_save_one, parquet_files))
 
 
 def _save_or_return_parquet_files_from_txt_in_zip(
@@ -181,42 +828,96 @@ def _save_or_return_parquet_files_from_txt_in_zip(
     Returns:
         list[pd.DataFrame]: The extracted DataFrames if save_to_path is not provided.
     """
-    oecd_txt_args = {
-        "delimiter": "|",
-        "encoding": "utf-8",
-        "quotechar": '"',
-        "low_memory": False,
-    }
+
+    # If save_to_path is not provided, return the DataFrames
+    if not save_to_path:
+        return list(_iter_frames(response, is_txt=True))
 
     # Convert the save_to_path to a Path object
-    save_to_path = Path(save_to_path) if save_to_path else None
+    save_to_path = Path(save_to_path)
 
-    # Open the content as a zip file and extract the parquet files
-    with zipfile.ZipFile(io.BytesIO(response.content)) as z:
-        # Find all parquet files in the zip archive
+    # Open the content as a zip file and extract the txt files
+    with _open_zip(response) as z:
+        # Find all txt files in the zip archive
         files = [name for name in z.namelist() if name.endswith(".txt")]
 
-        # If save_to_path is provided, save the files to the path
-        if save_to_path:
-            save_to_path.mkdir(parents=True, exist_ok=True)
-            for file_name in files:
-                clean_name = (
-                    file_name.replace(".txt", ".parquet").lower().replace(" ", "_")
-                )
-                logger.info(f"Saving {clean_name}")
-                with z.open(file_name) as f_in:
-                    pd.read_csv(f_in, **oecd_txt_args).to_parquet(
-                        save_to_path / clean_name
-                    )
-            return
+        # Save the files to the path, as parquet
+        save_to_path.mkdir(parents=True, exist_ok=True)
+        for file_name in files:
+            clean_name = _clean_name(file_name)
+            logger.info(f"Saving {clean_name}")
+            table = _read_txt_table(partial(z.open, file_name))
+            with _atomic_path(save_to_path / clean_name) as tmp_path:
+                pq.write_table(table, tmp_path, **PARQUET_WRITE_ARGS)
 
-        # If save_to_path is not provided, return the DataFrames
-        logger.info(f"Reading {len(files)} files.")
-        return [pd.read_csv(z.open(file), **oecd_txt_args) for file in files]
+
+def _get_bulk_file(file_id: str) -> requests.Response:
+    """Request a file from the stats.oecd.org file download service.
+
+    Args:
+        file_id (str): The ID of the file to download.
+
+    Returns:
+        requests.Response: The response object.
+    """
+    # Construct the URL
+    file_url = BULK_DOWNLOAD_URL + file_id
+
+    # Get the file
+    response = requests.get(file_url, stream=True)
+
+    # Check if the request was successful
+    response.raise_for_status()
+
+    return response
+
+
+def iter_bulk_download_parquet(
+    file_id: str,
+    is_txt: bool = False,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+    batch_size: int | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Download data from the stats.oecd.org file download service, one file at a time.
+
+    Unlike `bulk_download_parquet`, the files in the archive are never combined into a
+    single DataFrame. Each file is yielded as soon as it is read, so only one of them
+    needs to be held in memory at any given time. With `batch_size`, parquet files are
+    also streamed, so only one batch of rows is held in memory.
+
+    Args:
+        file_id (str): The ID of the file to download.
+        is_txt (bool): Whether the file is a .txt file. Defaults to False.
+        columns (list[str] | None): The columns to read. Optional. If not provided,
+        all columns are read.
+        filters (list | None): Row filters, in the `pyarrow.parquet` format (e.g.
+        `[("Year", ">=", 2020)]`). Optional. Row groups which can't match are skipped.
+        batch_size (int | None): The maximum number of rows per yielded item.
+        Optional. If not provided, each file is yielded whole.
+
+    Yields:
+        pd.DataFrame: One DataFrame per file in the archive (or per batch of rows).
+    """
+    logger.info("Downloading bulk file. This may take a while...")
+
+    response = _get_bulk_file(file_id)
+
+    yield from _iter_frames(
+        response,
+        is_txt=is_txt,
+        columns=columns,
+        filters=filters,
+        batch_size=batch_size,
+    )
 
 
 def bulk_download_parquet(
-    file_id: str, save_to_path: Path | str | None = None, is_txt: bool = False
+    file_id: str,
+    save_to_path: Path | str | None = None,
+    is_txt: bool = False,
+    columns: list[str] | None = None,
+    filters: list | None = None,
 ) -> pd.DataFrame | None:
     """Download data from the stats.oecd.org file download service.
 
@@ -228,53 +929,122 @@ def bulk_download_parquet(
         save_to_path (Path | str | None): The path to save the file to. Optional. If
         not provided, a DataFrame is returned.
         is_txt (bool): Whether the file is a .txt file. Defaults to False.
+        columns (list[str] | None): The columns to read. Optional. If not provided,
+        all columns are read. Only used when a DataFrame is returned (saved files
+        always contain all the columns).
+        filters (list | None): Row filters, in the `pyarrow.parquet` format (e.g.
+        `[("Year", ">=", 2020)]`). Optional. Row groups which can't match are skipped.
+        Only used when a DataFrame is returned.
 
     Returns:
         pd.DataFrame | None: The DataFrame if save_to_path is not provided.
     """
 
-    # Construct the URL
-    file_url = BULK_DOWNLOAD_URL + file_id
-
-    # Inform the user about what the function will do (save or return)
+    # If a path is provided, save the files and return
     if save_to_path:
         logger.info(f"Downloading parquet file and saving to {save_to_path}.")
-    else:
-        logger.info(
-            "Downloading parquet file, which will be returned as a DataFrame. "
-            "This may take a while..."
+        response = _get_bulk_file(file_id)
+
+        if is_txt:
+            _save_or_return_parquet_files_from_txt_in_zip(response, save_to_path)
+        else:
+            _save_or_return_parquet_files_from_content(response, save_to_path)
+
+        logger.info("File saved correctly.")
+        return
+
+    # Otherwise, read all the files and combine them
+    logger.info("Downloading bulk file. This may take a while...")
+    response = _get_bulk_file(file_id)
+    tables = _read_tables(response, is_txt=is_txt, columns=columns, filters=filters)
+
+    if not tables:
+        logger.info("No files found in the archive.")
+        return
+
+    combined_df = _tables_to_df(tables)
+    logger.info("File downloaded correctly.")
+
+    return combined_df
+
+
+def bulk_download_parquet_many(
+    file_ids: list[str],
+    save_to_path: Path | str | None = None,
+    is_txt: bool = False,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+) -> pd.DataFrame | None:
+    """Download several files from the stats.oecd.org file download service.
+
+    The files are downloaded (and read) concurrently, so a file can be downloaded
+    while another one is being decompressed. See `bulk_download_parquet`.
+
+    Args:
+        file_ids (list[str]): The IDs of the files to download.
+        save_to_path (Path | str | None): The path to save the files to. Optional. If
+        not provided, a single DataFrame is returned.
+        is_txt (bool): Whether the files are .txt files. Defaults to False.
+        columns (list[str] | None): The columns to read. Optional. If not provided,
+        all columns are read. Only used when a DataFrame is returned.
+        filters (list | None): Row filters, in the `pyarrow.parquet` format. Optional.
+        Only used when a DataFrame is returned.
+
+    Returns:
+        pd.DataFrame | None: The combined DataFrame if save_to_path is not provided.
+    """
+
+    def _download_one(file_id: str) -> list[pa.Table]:
+        response = _get_bulk_file(file_id)
+
+        # If a path is provided, save the files
+        if save_to_path:
+            if is_txt:
+                _save_or_return_parquet_files_from_txt_in_zip(response, save_to_path)
+            else:
+                _save_or_return_parquet_files_from_content(response, save_to_path)
+            return []
+
+        return list(
+            _iter_tables(response, is_txt=is_txt, columns=columns, filters=filters)
         )
 
-    # Get the file
-    response = requests.get(file_url, stream=True)
-    # Check if the request was successful
-    response.raise_for_status()
+    logger.info(f"Downloading {len(file_ids)} bulk files. This may take a while...")
 
-    # Read the parquet file
-    if is_txt:
-        files = _save_or_return_parquet_files_from_txt_in_zip(response, save_to_path)
-    else:
-        files = _save_or_return_parquet_files_from_content(response, save_to_path)
+    workers = max(1, min(MAX_WORKERS, len(file_ids)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        tables = [
+            table for batch in executor.map(_download_one, file_ids) for table in batch
+        ]
 
-    if files:
-        combined_df = pd.concat(files, ignore_index=True)
-        logger.info("File downloaded correctly.")
-        return combined_df
+    if save_to_path:
+        logger.info("Files saved correctly.")
+        return
 
-    logger.info("File saved correctly.")
+    if not tables:
+        logger.info("No files found in the archives.")
+        return
 
+    combined_df = _tables_to_df(tables)
+    logger.info("Files downloaded correctly.")
 
+    return combined_df
+
+
+@lru_cache
 def get_bulk_file_id(
     flow_url: str, search_string: str, latest_flow: float = 1.4, retries: int = 0
 ) -> str:
     """
-    Retrieves the full bulk file ID from the OECD dataflow.
+    Retrieves the full bulk file ID from the OECD dataflow. The ID is only looked up
+    once per process for each set of arguments (use `get_bulk_file_id.cache_clear()`
+    to look it up again).
 
     Args:
         flow_url (str): The URL of the dataflow to check.
         search_string (str): The string to search for in the response content.
         latest_flow (float): The latest version of the dataflow to check.
-        retries (int): The current number of retries (to avoid infinite recursion).
+        retries (int): The number of retries already used.
 
     Returns:
         str: The ID of the bulk download file.
@@ -283,29 +1053,30 @@ def get_bulk_file_id(
         KeyError: If the bulk download file link could not be found.
         RuntimeError: If the maximum number of retries is exceeded.
     """
-    if retries > MAX_RETRIES:
-        raise RuntimeError(f"Maximum retries ({MAX_RETRIES}) exceeded.")
+    # Try the latest version of the dataflow, falling back to previous versions
+    while True:
+        if retries > MAX_RETRIES:
+            raise RuntimeError(f"Maximum retries ({MAX_RETRIES}) exceeded.")
 
-    if latest_flow == 1.0:
-        latest_flow = int(round(latest_flow, 0))
+        if latest_flow == 1.0:
+            latest_flow = int(round(latest_flow, 0))
 
-    try:
-        response = requests.get(f"{flow_url}{latest_flow}")
-        response.raise_for_status()
-    except requests.exceptions.HTTPError:
-        return get_bulk_file_id(
-            flow_url=flow_url,
-            search_string=search_string,
-            latest_flow=round(latest_flow - FALLBACK_STEP, 1),
-            retries=retries + 1,
-        )
+        try:
+            response = requests.get(f"{flow_url}{latest_flow}")
+            response.raise_for_status()
+            break
+        except requests.exceptions.HTTPError:
+            latest_flow = round(latest_flow - FALLBACK_STEP, 1)
+            retries += 1
 
+    # The link follows the search string, up to the next closing tag
     content = response.text
-    match = re.search(f"{re.escape(search_string)}(.*?)</", content)
+    start = content.find(search_string)
+    end = content.find("</", start + len(search_string)) if start >= 0 else -1
 
-    if not match:
+    if end < 0:
         raise KeyError(f"The link to the bulk download file could not be found.")
 
-    parquet_link = match.group(1).strip()
+    parquet_link = content[start + len(search_string) : end].strip()
 
     return parquet_link.split("=")[-1]
@@ -1,5 +1,9 @@
 """ A module for constructing SDMX API queries for the OECD data. """
 
+import logging
+from functools import lru_cache
+from urllib.parse import quote, urlencode
+
 from oda_reader.common import logger
 
 V1_BASE_URL: str = "https://sdmx.oecd.org/public/rest/data/"
@@ -9,6 +13,26 @@ SHAPE: str = "dimensionAtObservation=AllDimensions"
 FORMAT: str = "csvfilewithlabels"
 
 
+@lru_cache(maxsize=256)
+def _encode_query(base_url: str, filter_string: str, params: tuple) -> str:
+    """Encode a query URL. The URLs are cached, so identical queries (even from
+    different QueryBuilder instances) are only encoded once.
+
+    Args:
+        base_url (str): The base URL, including the dataflow.
+        filter_string (str): The dimensions filter.
+        params (tuple): The query parameters, as (key, value) pairs.
+
+    Returns:
+        str: The full query URL.
+    """
+    # Percent-encode the filter and the parameters, keeping the SDMX operators
+    filter_string = quote(filter_string, safe="+*.")
+    query = urlencode(params, safe="+:*[]")
+
+    return f"{base_url}{filter_string}?{query}"
+
+
 class QueryBuilder:
     """
     A builder class for constructing SDMX API queries for the OECD data.
@@ -20,6 +44,16 @@ class QueryBuilder:
         api_version (int): The version of the API to use.
     """
 
+    __slots__ = (
+        "_separator",
+        "_none_str",
+        "agency_id",
+        "filter",
+        "base_url",
+        "params",
+        "api_version",
+    )
+
     def __init__(
         self,
         dataflow_id: str,
@@ -43,6 +77,9 @@ class QueryBuilder:
         base_url = V2_BASE_URL if api_version == 2 else V1_BASE_URL
         self._separator = "/" if api_version == 2 else ","
 
+        # Set the value used for dimensions which are not filtered
+        self._none_str = "*" if api_version == 2 else ""
+
         # Set the agency ID
         self.agency_id = AGENCY_ID
 
@@ -74,16 +111,23 @@ class QueryBuilder:
         """
 
         if param is None:
-            return "*" if self.api_version == 2 else ""
-        if isinstance(param, str):
-            param = [param]
-
-        if (self.api_version == 2) & (len(param) > 1):
-            logger.info(
-                f"API version 2 does not support filtering on multiple values:"
-                f"\n{(', '.join(param))} \n"
-                "Returning all values."
-            )
+            return self._none_str
+
+        # A single value is used as is
+        if isinstance(param, (str, int)):
+            return str(param)
+
+        # Drop repeated values (keeping their order)
+        param = list(dict.fromkeys(str(value) for value in param))
+
+        if self.api_version == 2 and len(param) > 1:
+            # Only build the message if it will be logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"API version 2 does not support filtering on multiple values:"
+                    f"\n{(', '.join(param))} \n"
+                    "Returning all values."
+                )
             return "*"
 
         return "+".join(param)
@@ -144,14 +188,15 @@ class QueryBuilder:
         # if any of the parameters are None, set them to the default value
         donor = self._to_filter_str(donor)
         measure = self._to_filter_str(measure)
-        untied = self._to_filter_str(None)
+        untied = self._none_str
         flow_type = self._to_filter_str(flow_type)
         unit_measure = self._to_filter_str(unit_measure)
         price_base = self._to_filter_str(price_base)
-        period = self._to_filter_str(None)
+        period = self._none_str
 
-        return ".".join(
-            [donor, measure, untied, flow_type, unit_measure, price_base, period]
+        return (
+            f"{donor}.{measure}.{untied}.{flow_type}."
+            f"{unit_measure}.{price_base}.{period}"
         )
 
     def build_dac2a_filter(
@@ -185,7 +230,7 @@ class QueryBuilder:
         unit_measure = self._to_filter_str(unit_measure)
         price_base = self._to_filter_str(price_base)
 
-        return ".".join([donor, recipient, measure, unit_measure, price_base])
+        return f"{donor}.{recipient}.{measure}.{unit_measure}.{price_base}"
 
     def build_crs_filter(
         self,
@@ -228,25 +273,14 @@ class QueryBuilder:
         flow_type = self._to_filter_str(flow_type)
         price_base = self._to_filter_str(price_base)
         unit_measure = self._to_filter_str(unit_measure)
-        md_id = self._to_filter_str(None)
+        md_id = self._none_str
         if microdata:
             md_dim = "DD"
         else:
             md_dim = "_T"
-        return ".".join(
-            [
-                donor,
-                recipient,
-                sector,
-                measure,
-                channel,
-                modality,
-                flow_type,
-                price_base,
-                md_dim,
-                md_id,
-                unit_measure,
-            ]
+        return (
+            f"{donor}.{recipient}.{sector}.{measure}.{channel}.{modality}."
+            f"{flow_type}.{price_base}.{md_dim}.{md_id}.{unit_measure}"
         )
 
     def build_multisystem_filter(
@@ -287,22 +321,12 @@ class QueryBuilder:
         flow_type = self._to_filter_str(flow_type)
         price_base = self._to_filter_str(price_base)
         md_dim = self._to_filter_str("_T")
-        md_id = self._to_filter_str(None)
-        unit_measure = self._to_filter_str(None)
-
-        return ".".join(
-            [
-                donor,
-                recipient,
-                sector,
-                measure,
-                channel,
-                flow_type,
-                price_base,
-                md_dim,
-                md_id,
-                unit_measure,
-            ]
+        md_id = self._none_str
+        unit_measure = self._none_str
+
+        return (
+            f"{donor}.{recipient}.{sector}.{measure}.{channel}."
+            f"{flow_type}.{price_base}.{md_dim}.{md_id}.{unit_measure}"
         )
 
     def set_filter(self, filter_string: str) -> "QueryBuilder":
@@ -348,11 +372,4 @@ class QueryBuilder:
         Returns:
             str: The fully constructed URL.
         """
-        # Create list to contain query parts
-        query_parts = [self.base_url + self.filter + "?"]
-
-        # Add each parameter to the query
-        query_parts.extend(f"{key}={value}&" for key, value in self.params.items())
-
-        # Return the full query URL, removing the trailing "&"
-        return "".join(query_parts).rstrip("&")
+        return _encode_query(self.base_url, self.filter, tuple(self.params.items()))
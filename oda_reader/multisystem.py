@@ -11,6 +11,7 @@ from oda_reader.download.download_tools import (
 )
 
 DATAFLOW_ID: str = "DSD_MULTI@DF_MULTI"
+DATAFLOW_VERSION: str = "1.1"
 
 
 def get_full_multisystem_id():
@@ -19,7 +20,9 @@ def get_full_multisystem_id():
     )
 
 
-def bulk_download_multisystem(save_to_path: Path | str | None = None):
+def bulk_download_multisystem(
+    save_to_path: Path | str | None = None, columns: list[str] | None = None
+):
     """
     Download the Multisystem data from the bulk download service. The file is very large.
     It is therefore strongly recommended to save it to disk. If save_to_path is not
@@ -28,7 +31,8 @@ def bulk_download_multisystem(save_to_path: Path | str | None = None):
     Args:
         save_to_path: The path to save the file to. Optional. If not provided, a
         DataFrame is returned.
-
+        columns: The columns to read. Optional. If not provided, all columns are
+        read. Only used when a DataFrame is returned.
 
     Returns:
         pd.DataFrame | None: The DataFrame if save_to_path is not provided.
@@ -38,7 +42,7 @@ def bulk_download_multisystem(save_to_path: Path | str | None = None):
     file_id = get_full_multisystem_id()
 
     return bulk_download_parquet(
-        file_id=file_id, save_to_path=save_to_path, is_txt=True
+        file_id=file_id, save_to_path=save_to_path, is_txt=True, columns=columns
     )
 
 
@@ -72,7 +76,7 @@ def download_multisystem(
 
     # Inform of the dataflow being downloaded
     if dataflow_version is None:
-        dataflow_version = "1.1"
+        dataflow_version = DATAFLOW_VERSION
     logger.info(f"Downloading dataflow version {dataflow_version}")
 
     if not filters:
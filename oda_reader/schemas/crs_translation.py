@@ -1,12 +1,15 @@
+from types import MappingProxyType
+
 import pandas as pd
 
 from oda_reader.common import ImporterPaths
 from oda_reader.schemas.dac1_translation import prices_mapping
-from oda_reader.schemas.schema_tools import map_area_codes, map_amount_type_codes
+from oda_reader.schemas.schema_tools import map_area_and_amount_type_codes
 from oda_reader.schemas.xml_tools import (
     parse_xml,
     extract_dac_to_area_codes,
     read_mapping,
+    cache_mapping,
 )
 
 MAPPINGS = {
@@ -15,12 +18,14 @@ MAPPINGS = {
 }
 
 
-def area_code_mapping() -> dict:
-    """Reads the area code mapping."""
-    return read_mapping(
-        MAPPINGS["dac2_codes_area"], keys_as_int=True, update=lambda d: d
-    ) | read_mapping(
-        MAPPINGS["area_code_corrections"], keys_as_int=True, update=lambda d: d
+@cache_mapping
+def area_code_mapping() -> MappingProxyType:
+    """Reads the area code mapping (once, until the mappings are updated)."""
+    return MappingProxyType(
+        read_mapping(MAPPINGS["dac2_codes_area"], keys_as_int=True, update=lambda d: d)
+        | read_mapping(
+            MAPPINGS["area_code_corrections"], keys_as_int=True, update=lambda d: d
+        )
     )
 
 
@@ -38,23 +43,9 @@ def convert_crs_to_dotstat_codes(df: pd.DataFrame) -> pd.DataFrame:
     # Prices mapping
     prices_codes = prices_mapping()
 
-    # Map the donor codes
-    df = map_area_codes(df, area_code_mapping=area_codes)
-
-    # Map region codes
-    df = map_area_codes(
-        df,
-        area_code_mapping=area_codes,
-        source_column="recipient_code",
-        target_column="recipient_code",
-    )
-
-    # Map the prices codes
-    df = map_amount_type_codes(
-        df,
-        prices_mapping=prices_codes,
-        source_column="data_type_code",
-        target_column="data_type_code",
+    # Map the donor, region and prices codes
+    df = map_area_and_amount_type_codes(
+        df, area_code_mapping=area_codes, prices_mapping=prices_codes
     )
 
     return df
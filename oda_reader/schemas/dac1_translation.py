@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 import pandas as pd
 
 from oda_reader.common import ImporterPaths
@@ -12,6 +14,7 @@ from oda_reader.schemas.xml_tools import (
     extract_datatypes_to_prices_codes,
     extract_flowtype_to_flowtype_codes,
     read_mapping,
+    cache_mapping,
 )
 
 MAPPINGS = {
@@ -45,34 +48,43 @@ def update_dac1_translation_mappings():
     extract_dac_to_area_codes(xml_dict=xml_data, filename=MAPPINGS["dac1_codes_area"])
 
 
-def area_code_mapping() -> dict:
-    """Reads the area code mapping."""
-    return read_mapping(
-        MAPPINGS["dac1_codes_area"],
-        keys_as_int=True,
-        update=update_dac1_translation_mappings,
-    ) | read_mapping(
-        MAPPINGS["area_code_corrections"],
-        keys_as_int=True,
-        update=update_dac1_translation_mappings,
+@cache_mapping
+def area_code_mapping() -> MappingProxyType:
+    """Reads the area code mapping (once, until the mappings are updated)."""
+    return MappingProxyType(
+        read_mapping(
+            MAPPINGS["dac1_codes_area"],
+            keys_as_int=True,
+            update=update_dac1_translation_mappings,
+        )
+        | read_mapping(
+            MAPPINGS["area_code_corrections"],
+            keys_as_int=True,
+            update=update_dac1_translation_mappings,
+        )
     )
 
 
-def prices_mapping() -> dict:
-    """Reads the prices mapping."""
-    return read_mapping(
-        MAPPINGS["dac1_codes_prices"],
-        keys_as_int=False,
-        update=update_dac1_translation_mappings,
-    ) | read_mapping(
-        MAPPINGS["prices_corrections"],
-        keys_as_int=False,
-        update=update_dac1_translation_mappings,
+@cache_mapping
+def prices_mapping() -> MappingProxyType:
+    """Reads the prices mapping (once, until the mappings are updated)."""
+    return MappingProxyType(
+        read_mapping(
+            MAPPINGS["dac1_codes_prices"],
+            keys_as_int=False,
+            update=update_dac1_translation_mappings,
+        )
+        | read_mapping(
+            MAPPINGS["prices_corrections"],
+            keys_as_int=False,
+            update=update_dac1_translation_mappings,
+        )
     )
 
 
-def flow_types_mapping() -> dict:
-    """Reads the flow types mapping."""
+@cache_mapping
+def flow_types_mapping() -> MappingProxyType:
+    """Reads the flow types mapping (once, until the mappings are updated)."""
     return read_mapping(
         MAPPINGS["dac1_codes_flow_types"],
         keys_as_int=False,
@@ -1,12 +1,15 @@
+from types import MappingProxyType
+
 import pandas as pd
 
 from oda_reader.common import ImporterPaths
 from oda_reader.schemas.dac1_translation import prices_mapping
-from oda_reader.schemas.schema_tools import map_area_codes, map_amount_type_codes
+from oda_reader.schemas.schema_tools import map_area_and_amount_type_codes
 from oda_reader.schemas.xml_tools import (
     parse_xml,
     extract_dac_to_area_codes,
     read_mapping,
+    cache_mapping,
 )
 
 DAC2_TRANSLATION_SCHEMA_URL = (
@@ -27,16 +30,20 @@ def update_dac2_translation_mappings():
     extract_dac_to_area_codes(xml_dict=xml_data, filename=MAPPINGS["dac2_codes_area"])
 
 
-def area_code_mapping() -> dict:
-    """Reads the area code mapping."""
-    return read_mapping(
-        MAPPINGS["dac2_codes_area"],
-        keys_as_int=True,
-        update=update_dac2_translation_mappings,
-    ) | read_mapping(
-        MAPPINGS["area_code_corrections"],
-        keys_as_int=True,
-        update=update_dac2_translation_mappings,
+@cache_mapping
+def area_code_mapping() -> MappingProxyType:
+    """Reads the area code mapping (once, until the mappings are updated)."""
+    return MappingProxyType(
+        read_mapping(
+            MAPPINGS["dac2_codes_area"],
+            keys_as_int=True,
+            update=update_dac2_translation_mappings,
+        )
+        | read_mapping(
+            MAPPINGS["area_code_corrections"],
+            keys_as_int=True,
+            update=update_dac2_translation_mappings,
+        )
     )
 
 
@@ -54,23 +61,9 @@ def convert_dac2a_to_dotstat_codes(df: pd.DataFrame) -> pd.DataFrame:
     # Prices mapping
     prices_codes = prices_mapping()
 
-    # Map the donor codes
-    df = map_area_codes(df, area_code_mapping=area_codes)
-
-    # Map region codes
-    df = map_area_codes(
-        df,
-        area_code_mapping=area_codes,
-        source_column="recipient_code",
-        target_column="recipient_code",
-    )
-
-    # Map the prices codes
-    df = map_amount_type_codes(
-        df,
-        prices_mapping=prices_codes,
-        source_column="data_type_code",
-        target_column="data_type_code",
+    # Map the donor, region and prices codes
+    df = map_area_and_amount_type_codes(
+        df, area_code_mapping=area_codes, prices_mapping=prices_codes
     )
 
     return df
@@ -2,7 +2,7 @@ import pandas as pd
 
 from oda_reader.schemas.dac1_translation import prices_mapping
 from oda_reader.schemas.dac2_translation import area_code_mapping
-from oda_reader.schemas.schema_tools import map_area_codes, map_amount_type_codes
+from oda_reader.schemas.schema_tools import map_area_and_amount_type_codes
 
 
 def convert_multisystem_to_dotstat_codes(df: pd.DataFrame) -> pd.DataFrame:
@@ -21,23 +21,9 @@ def convert_multisystem_to_dotstat_codes(df: pd.DataFrame) -> pd.DataFrame:
     # Prices mapping
     prices_codes = prices_mapping()
 
-    # Map the donor codes
-    df = map_area_codes(df, area_code_mapping=area_codes)
-
-    # Map region codes
-    df = map_area_codes(
-        df,
-        area_code_mapping=area_codes,
-        source_column="recipient_code",
-        target_column="recipient_code",
-    )
-
-    # Map the prices codes
-    df = map_amount_type_codes(
-        df,
-        prices_mapping=prices_codes,
-        source_column="data_type_code",
-        target_column="data_type_code",
+    # Map the donor, region and prices codes
+    df = map_area_and_amount_type_codes(
+        df, area_code_mapping=area_codes, prices_mapping=prices_codes
     )
 
     return df
@@ -1,27 +1,29 @@
-import json
+from functools import lru_cache
+from types import MappingProxyType
 
 import pandas as pd
 
-from oda_reader.common import logger, ImporterPaths
+from oda_reader.common import logger, ImporterPaths, read_json
 
 
-def read_schema_translation(version: str = "dac1") -> dict:
+@lru_cache
+def read_schema_translation(version: str = "dac1") -> MappingProxyType:
     """
     Reads the schema translation to map the API response to the .stat schema.
+    The schema is only read from disk once per version.
 
     Args:
         version: The version of the schema to read. Defaults to "dac1".
 
     Returns:
-        dict: The schema translation.
+        MappingProxyType: The schema translation (read-only).
     """
     logger.info(f"Reading the {version} schema translation")
 
     # Load the schema translation
-    with open(ImporterPaths.mappings / f"{version}_dotstat.json", "r") as f:
-        mapping = json.load(f)
+    mapping = read_json(ImporterPaths.mappings / f"{version}_dotstat.json")
 
-    return mapping
+    return MappingProxyType(mapping)
 
 
 def get_dtypes(schema: dict) -> dict:
@@ -83,6 +85,86 @@ def get_columns_to_keep(schema: dict) -> list:
     return columns_to_keep
 
 
+def map_unique_values(
+    series: pd.Series, mapping: dict, dtype: str
+) -> pd.api.extensions.ExtensionArray:
+    """
+    Map the values of a Series using a dictionary. Rather than looking up every row,
+    the Series is factorized and only its unique values are mapped. The result is then
+    gathered back to the full length of the Series using the factorized codes.
+
+    Args:
+        series: The Series containing the values to map.
+        mapping: The mapping between the old and new values.
+        dtype: The data type of the mapped values.
+
+    Returns:
+        pd.api.extensions.ExtensionArray: The mapped values. Values which are missing
+        or not found in the mapping are returned as missing.
+
+    """
+    # Get an integer code per row, and the unique values those codes refer to
+    codes, uniques = pd.factorize(series)
+
+    # Map the unique values only
+    mapped = pd.array([mapping.get(value) for value in uniques], dtype=dtype)
+
+    # Gather the mapped values for every row (missing values have a code of -1)
+    return mapped.take(codes, allow_fill=True)
+
+
+def _is_mapped(series: pd.Series, mapping: dict) -> bool:
+    """
+    Check whether the values of a Series have already been mapped, i.e. whether all of
+    its (non-missing) unique values are values of the mapping.
+
+    Args:
+        series: The Series to check.
+        mapping: The mapping.
+
+    Returns:
+        bool: Whether all the values are already mapped values.
+
+    """
+    return set(series.dropna().unique()) <= set(mapping.values())
+
+
+def _map_codes(
+    df: pd.DataFrame,
+    mapping: dict,
+    source_column: str,
+    target_column: str,
+    dtype: str,
+) -> pd.DataFrame:
+    """
+    Map the codes of a column, writing the result to the target column. If the codes
+    have already been mapped, they are copied to the target column as they are.
+
+    Args:
+        df: The DataFrame containing the codes.
+        mapping: The mapping between the new and old codes.
+        source_column: The column containing the codes.
+        target_column: The column to map the codes to.
+        dtype: The data type of the target column.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the mapped codes.
+
+    """
+    # If all the codes are old codes (e.g. they were already mapped), keep them
+    if _is_mapped(df[source_column], mapping):
+        logger.debug(f"The codes in {source_column} are already mapped. Skipping.")
+        df[target_column] = df[source_column].astype(dtype)
+        return df
+
+    # Map the new codes to the old codes
+    df[target_column] = map_unique_values(
+        df[source_column], mapping=mapping, dtype=dtype
+    )
+
+    return df
+
+
 def map_area_codes(
     df: pd.DataFrame,
     area_code_mapping: dict,
@@ -107,9 +189,13 @@ def map_area_codes(
     donor_codes = {v: k for k, v in area_code_mapping.items()}
 
     # Map the new codes to the old codes
-    df[target_column] = df[source_column].map(donor_codes).astype("int32[pyarrow]")
-
-    return df
+    return _map_codes(
+        df,
+        mapping=donor_codes,
+        source_column=source_column,
+        target_column=target_column,
+        dtype="int32[pyarrow]",
+    )
 
 
 def map_amount_type_codes(
@@ -133,9 +219,57 @@ def map_amount_type_codes(
     """
 
     # Map the new codes to the old codes
-    df[target_column] = df[source_column].map(prices_mapping)
+    return _map_codes(
+        df,
+        mapping=prices_mapping,
+        source_column=source_column,
+        target_column=target_column,
+        dtype="string[pyarrow]",
+    )
 
-    return df
+
+def map_area_and_amount_type_codes(
+    df: pd.DataFrame,
+    area_code_mapping: dict,
+    prices_mapping: dict,
+    area_columns: tuple[str, ...] = ("donor_code", "recipient_code"),
+    prices_column: str = "data_type_code",
+) -> pd.DataFrame:
+    """
+    Map the new area codes (e.g. donor and recipient) and the new aidtype codes to the
+    old codes. The area code mapping is only swapped once for all the area columns.
+
+    Args:
+        df: The DataFrame containing the new codes.
+        area_code_mapping: The mapping between the new and old area codes.
+        prices_mapping: The mapping between the new and old aidtype codes.
+        area_columns: The columns containing area codes.
+        prices_column: The column containing the aidtype codes.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the old codes.
+
+    """
+    # Swap the keys and values in the dictionary
+    area_codes = {v: k for k, v in area_code_mapping.items()}
+
+    # Map the new codes to the old codes, one column at a time
+    for column in area_columns:
+        df = _map_codes(
+            df,
+            mapping=area_codes,
+            source_column=column,
+            target_column=column,
+            dtype="int32[pyarrow]",
+        )
+
+    return _map_codes(
+        df,
+        mapping=prices_mapping,
+        source_column=prices_column,
+        target_column=prices_column,
+        dtype="string[pyarrow]",
+    )
 
 
 def convert_unit_measure_to_amount_type(df: pd.DataFrame) -> pd.DataFrame:
@@ -151,24 +285,30 @@ def convert_unit_measure_to_amount_type(df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: The DataFrame with the amount type column.
 
     """
-    non_usd = (
-        df.loc[lambda d: d["unit_measure_code"] != "USD"]
-        .drop(columns=["amounttype_code", "amount_type"])
-        .rename(
-            columns={
-                "unit_measure_code": "amounttype_code",
-                "unit_measure_name": "amount_type",
-            }
-        )
+    # Flag the rows which are not expressed in USD
+    non_usd = ~df["unit_measure_code"].eq("USD").fillna(False).to_numpy(dtype=bool)
+
+    # The unit measure columns are no longer needed
+    columns = df.columns.drop(["unit_measure_code", "unit_measure_name"])
+
+    # For the rows not in USD, the unit measure becomes the amount type. The columns
+    # are gathered into a new frame, so the input DataFrame is not modified.
+    converted = pd.DataFrame(
+        {column: df[column] for column in columns}
+        | {
+            "amounttype_code": df["unit_measure_code"].where(
+                non_usd, df["amounttype_code"]
+            ),
+            "amount_type": df["unit_measure_name"].where(non_usd, df["amount_type"]),
+        },
+        copy=False,
     )
 
-    df = df.loc[lambda d: d.unit_measure_code == "USD"]
+    # Dropping the unit measure can generate duplicates. Check all the rows.
+    duplicated = converted.duplicated().to_numpy()
 
-    return (
-        pd.concat([df, non_usd], ignore_index=True)
-        .drop(columns=["unit_measure_code", "unit_measure_name"])
-        .drop_duplicates()  # USD can generate duplicates
-    )
+    # Select the rows to keep with a single copy
+    return converted.loc[~duplicated].reset_index(drop=True)
 
 
 def preprocess(df: pd.DataFrame, schema_translation: dict) -> pd.DataFrame:
@@ -186,15 +326,17 @@ def preprocess(df: pd.DataFrame, schema_translation: dict) -> pd.DataFrame:
     # Preprocess the data
     logger.info("Preprocessing the data")
 
-    # Get columns to keep
-    to_keep = get_columns_to_keep(schema=schema_translation)
-
-    # Get column name mapping
-    name_mapping = get_column_name_mapping(schema=schema_translation)
+    # Get the columns to keep (which are present in the data) and their new names
+    columns = {
+        column: settings["name"]
+        for column, settings in schema_translation.items()
+        if settings["keep"] and column in df.columns
+    }
 
-    logger.debug(f"Removing columns: {set(df.columns) - set(to_keep)}")
+    logger.debug(f"Removing columns: {set(df.columns) - set(columns)}")
 
-    # keep only selected columns, rename them
-    df = df.filter(items=to_keep).rename(columns=name_mapping)
+    # keep only selected columns (a single copy), then rename them in place
+    df = df.loc[:, list(columns)]
+    df.columns = list(columns.values())
 
     return df
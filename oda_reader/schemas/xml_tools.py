@@ -1,14 +1,21 @@
 import json
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Callable
 from xml.etree import ElementTree as ET
 
 import requests
 
-from oda_reader.common import logger
+from oda_reader.common import logger, read_json
+
+# Clear functions of the caches built from the mappings (see `cache_mapping`)
+_MAPPING_CACHE_CLEARS: list[Callable[[], None]] = []
 
 
 def download_xml(xml_url: str) -> requests.models.Response:
-    """Download the XML file from OECD.Stat.
+    """Download the XML file from OECD.Stat. The response is streamed, so the
+    content is not read until it is parsed.
 
     Args:
         xml_url (str): The URL of the XML file.
@@ -19,55 +26,111 @@ def download_xml(xml_url: str) -> requests.models.Response:
     logger.info(f"Downloading XML file from {xml_url}")
 
     # Get file with requests
-    response = requests.get(xml_url)
+    response = requests.get(xml_url, stream=True)
 
     # Check if the request was successful
     response.raise_for_status()
 
+    # Decompress the raw stream (if the server compressed it) while it is read
+    response.raw.decode_content = True
+
     # Return content
     return response
 
 
+def _iter_element_events(root: ET.Element):
+    """Walk an (already parsed) XML element, yielding the same ("start", element) and
+    ("end", element) events as `ET.iterparse`.
+
+    Args:
+        root: The element to walk.
+
+    Yields:
+        tuple: The event and the element it refers to.
+    """
+    yield "start", root
+
+    # Stack of the open elements, with an iterator over their remaining children
+    stack = [(root, iter(root))]
+
+    while stack:
+        element, children = stack[-1]
+        child = next(children, None)
+
+        # If all the children have been visited, close the element
+        if child is None:
+            stack.pop()
+            yield "end", element
+            continue
+
+        yield "start", child
+        stack.append((child, iter(child)))
+
+
 def xml_to_dict(root) -> dict:
     """Convert an XML file to a dictionary.
 
+    Files are parsed incrementally, keeping a stack of the elements which are still
+    open (instead of recursing through the tree). Elements are cleared as soon as they
+    have been converted. Parsed elements are walked the same way, but left untouched.
+
     Args:
-        root: The root of the XML file.
+        root: The root element of the XML, or a filename or file object containing it.
 
     Returns:
         dict: The XML file as a dictionary.
     """
     logger.info("Converting XML to dictionary")
-    # Create a dictionary to store the XML data
-    d = {}
 
-    # Add attributes to the dictionary
-    for key, val in root.attrib.items():
-        d[f"@{key}"] = val
+    # Walk parsed elements as they are. Parse files incrementally.
+    is_element = ET.iselement(root)
+    if is_element:
+        events = _iter_element_events(root)
+    else:
+        events = ET.iterparse(root, events=("start", "end"))
+
+    # Stack of dictionaries for the elements which have not been closed yet
+    stack = []
+    result = {}
+
+    for event, element in events:
+        # Create a dictionary for each new element, with its attributes
+        if event == "start":
+            stack.append({f"@{key}": val for key, val in element.attrib.items()})
+            continue
 
-    # If the root has text, add it to the dictionary
-    if root.text and root.text.strip():
-        d["#text"] = root.text.strip()
+        d = stack.pop()
 
-    # Add children to the dictionary
-    for child in root:
-        # Recursively convert children to dictionaries
-        child_dict = xml_to_dict(child)
+        # If the element has text, add it to the dictionary
+        if element.text and element.text.strip():
+            d["#text"] = element.text.strip()
 
         # Remove namespace
-        tag = child.tag.split("}")[-1]
+        tag = element.tag.split("}")[-1]
+
+        # Parsed elements have been converted, so they can be cleared
+        if not is_element:
+            element.clear()
+
+        # If this is the root, there is no parent to add it to
+        if not stack:
+            result = d
+            continue
+
+        parent = stack[-1]
 
-        # If the tag is already in the dictionary, append the child dictionary
-        if tag in d:
+        # If the tag is already in the parent, append the dictionary
+        if tag in parent:
             # Check if the tag is already a list
-            if not isinstance(d[tag], list):
-                d[tag] = [d[tag]]
-            # Append the child dictionary
-            d[tag].append(child_dict)
+            if not isinstance(parent[tag], list):
+                parent[tag] = [parent[tag]]
+            # Append the dictionary
+            parent[tag].append(d)
         else:
-            # Add the child dictionary to the dictionary
-            d[tag] = child_dict
-    return d
+            # Add the dictionary to the parent
+            parent[tag] = d
+
+    return result
 
 
 def parse_xml(xml_url: str) -> dict:
@@ -81,14 +144,9 @@ def parse_xml(xml_url: str) -> dict:
         dict: The XML file as a dictionary.
 
     """
-    # Download the XML file
-    response = download_xml(xml_url)
-
-    # Parse response content as room XML
-    xml_root = ET.fromstring(response.content)
-
-    # Convert the root of the XML to a dictionary
-    xml_dict = xml_to_dict(root=xml_root)
+    # Download the XML file, and parse it as it arrives
+    with download_xml(xml_url) as response:
+        xml_dict = xml_to_dict(response.raw)
 
     return xml_dict
 
@@ -112,6 +170,11 @@ def save_dict_to_json(dictionary: dict, filename: str) -> None:
     with open(rf"{filename}", "w") as f:
         f.write(json.dumps(dictionary, indent=4))
 
+    # Mappings read before this file was (re)written are no longer valid
+    _load_mapping.cache_clear()
+    for cache_clear in _MAPPING_CACHE_CLEARS:
+        cache_clear()
+
 
 def extract_representation_mapping(xml_dict: dict, index: int) -> list:
     """Extracts the representation mapping from the XML file."""
@@ -164,18 +227,51 @@ def extract_flowtype_to_flowtype_codes(xml_dict: dict, filename: str) -> None:
     representation_to_json(xml_dict, index=2, filename=filename)
 
 
-def read_mapping(mapping_path: str, keys_as_int: bool, update: callable) -> dict:
-    # Read the mapping from a JSON file. If it doesn't exist, create it.
+def cache_mapping(func: Callable[[], MappingProxyType]) -> Callable:
+    """Decorator to build a mapping (e.g. by combining several JSON files) only once.
+    The cached mapping is cleared whenever a mapping is saved again.
+
+    Args:
+        func: A function without arguments which returns a mapping.
+
+    Returns:
+        Callable: The cached function.
+    """
+    cached = lru_cache(maxsize=1)(func)
+    _MAPPING_CACHE_CLEARS.append(cached.cache_clear)
+
+    return cached
 
-    if not Path(mapping_path).exists():
-        logger.info(f"Not found, downloading.")
-        update()
 
-    with open(mapping_path, "r") as f:
-        mapping = json.load(f)
+@lru_cache
+def _load_mapping(mapping_path: str, keys_as_int: bool) -> MappingProxyType:
+    """Load a mapping from a JSON file. Each file is only read once, until it is
+    saved again.
+
+    Args:
+        mapping_path: The path to the JSON file.
+        keys_as_int: Whether to convert the keys to integers.
+
+    Returns:
+        MappingProxyType: The mapping (read-only).
+
+    """
+    mapping = read_json(mapping_path)
 
     # Convert keys to integers (if required)
     if keys_as_int:
         mapping = keys_to_int(mapping)
 
-    return mapping
+    return MappingProxyType(mapping)
+
+
+def read_mapping(
+    mapping_path: str, keys_as_int: bool, update: callable
+) -> MappingProxyType:
+    # Read the mapping from a JSON file. If it doesn't exist, create it.
+
+    if not Path(mapping_path).exists():
+        logger.info(f"Not found, downloading.")
+        update()
+
+    return _load_mapping(mapping_path, keys_as_int)
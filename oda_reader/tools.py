@@ -1,5 +1,21 @@
 """Additional tools for the API wrapper"""
 from collections import OrderedDict
+from pprint import pprint
+
+from oda_reader.download.query_builder import QueryBuilder
+
+# The filters accepted by each source, taken once from the filter builders
+_FILTER_SPECS: dict[str, OrderedDict] = {
+    source: OrderedDict(
+        (k, v) for k, v in builder.__annotations__.items() if k != "return"
+    )
+    for source, builder in {
+        "dac1": QueryBuilder.build_dac1_filter,
+        "dac2a": QueryBuilder.build_dac2a_filter,
+        "multisystem": QueryBuilder.build_multisystem_filter,
+        "crs": QueryBuilder.build_crs_filter,
+    }.items()
+}
 
 
 def get_available_filters(source: str, quiet: bool = False) -> dict:
@@ -14,22 +30,11 @@ def get_available_filters(source: str, quiet: bool = False) -> dict:
     Returns:
         dict: The available filters.
     """
-    from oda_reader import QueryBuilder as qb
-    from pprint import pprint
-
-    match source:
-        case "dac1":
-            f = qb.build_dac1_filter.__annotations__
-        case "dac2a":
-            f = qb.build_dac2a_filter.__annotations__
-        case "multisystem":
-            f = qb.build_multisystem_filter.__annotations__
-        case "crs":
-            f = qb.build_crs_filter.__annotations__
-        case _:
-            raise ValueError(f"Source '{source}' not recognized.")
-
-    available_filters = OrderedDict((k, v) for k, v in f.items() if k != "return")
+    if source not in _FILTER_SPECS:
+        raise ValueError(f"Source '{source}' not recognized.")
+
+    # Return a copy, so that the stored filters can't be modified
+    available_filters = _FILTER_SPECS[source].copy()
 
     if not quiet:
         pprint(available_filters)
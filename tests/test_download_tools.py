@@ -0,0 +1,43 @@
+import numpy as np
+
+from oda_reader.download import download_tools as dt
+from oda_reader.download.query_builder import QueryBuilder
+
+DAC1_ARGS = {
+    "filter_builder": QueryBuilder.build_dac1_filter,
+    "dataflow_id": "DSD_DAC1@DF_DAC1",
+    "dataflow_version": "1.2",
+    "start_year": 2018,
+    "end_year": 2022,
+}
+
+
+def test_filters_to_key_normalizes_lists_sets_and_arrays():
+    key = dt._filters_to_key({"measure": 1010, "donor": ["GBR", "FRA"]})
+
+    assert key == (("donor", ("FRA", "GBR")), ("measure", 1010))
+    assert dt._filters_to_key({"donor": {"GBR", "FRA"}, "measure": 1010}) == key
+    assert (
+        dt._filters_to_key({"donor": np.array(["GBR", "FRA"]), "measure": 1010}) == key
+    )
+
+
+def test_get_url_caches_normalized_filters():
+    dt._build_cached_url.cache_clear()
+
+    first = dt._get_url(**DAC1_ARGS, filters={"donor": ["GBR", "FRA"]})
+    second = dt._get_url(**DAC1_ARGS, filters={"donor": np.array(["FRA", "GBR"])})
+
+    assert first == second
+    assert "/FRA+GBR." in first
+    assert dt._build_cached_url.cache_info().hits == 1
+
+
+def test_get_url_builds_unnormalizable_filters_without_cache():
+    dt._build_cached_url.cache_clear()
+
+    # Values of mixed types cannot be sorted, so they cannot be cached
+    url = dt._get_url(**DAC1_ARGS, filters={"donor": ["FRA", 4]})
+
+    assert "/FRA+4." in url
+    assert dt._build_cached_url.cache_info().currsize == 0
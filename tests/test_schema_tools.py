@@ -0,0 +1,101 @@
+import pandas as pd
+
+from oda_reader.schemas.schema_tools import (
+    convert_unit_measure_to_amount_type,
+    map_amount_type_codes,
+    map_area_and_amount_type_codes,
+    map_area_codes,
+)
+
+AREA_CODES = {4: "FRA", 12: "GBR"}
+PRICES = {"V": "A", "Q": "D"}
+
+
+def test_map_area_codes_creates_target_when_already_mapped():
+    df = pd.DataFrame({"donor": [4, 12]})
+
+    result = map_area_codes(
+        df, AREA_CODES, source_column="donor", target_column="donor_code"
+    )
+
+    assert result["donor_code"].tolist() == [4, 12]
+    assert result["donor_code"].dtype == "int32[pyarrow]"
+
+
+def test_map_area_codes_casts_all_missing_column():
+    df = pd.DataFrame({"donor_code": [None, None]}, dtype=object)
+
+    result = map_area_codes(df, AREA_CODES)
+
+    assert result["donor_code"].isna().all()
+    assert result["donor_code"].dtype == "int32[pyarrow]"
+
+
+def test_map_amount_type_codes_creates_target_when_already_mapped():
+    df = pd.DataFrame({"prices": ["A", "D"]})
+
+    result = map_amount_type_codes(
+        df, PRICES, source_column="prices", target_column="amounttype_code"
+    )
+
+    assert result["amounttype_code"].tolist() == ["A", "D"]
+    assert result["amounttype_code"].dtype == "string[pyarrow]"
+
+
+def test_map_amount_type_codes_casts_all_missing_column():
+    df = pd.DataFrame({"amounttype_code": [None, None]}, dtype=object)
+
+    result = map_amount_type_codes(df, PRICES)
+
+    assert result["amounttype_code"].isna().all()
+    assert result["amounttype_code"].dtype == "string[pyarrow]"
+
+
+def test_map_area_and_amount_type_codes_casts_all_missing_columns():
+    df = pd.DataFrame(
+        {
+            "donor_code": ["FRA", "GBR"],
+            "recipient_code": [None, None],
+            "data_type_code": [None, None],
+        },
+        dtype=object,
+    )
+
+    result = map_area_and_amount_type_codes(df, AREA_CODES, PRICES)
+
+    assert result["donor_code"].tolist() == [4, 12]
+    assert result["donor_code"].dtype == "int32[pyarrow]"
+    assert result["recipient_code"].dtype == "int32[pyarrow]"
+    assert result["data_type_code"].dtype == "string[pyarrow]"
+
+
+def test_map_area_and_amount_type_codes_maps_new_codes():
+    df = pd.DataFrame(
+        {"donor_code": ["FRA"], "recipient_code": ["GBR"], "data_type_code": ["V"]}
+    )
+
+    result = map_area_and_amount_type_codes(df, AREA_CODES, PRICES)
+
+    assert result["donor_code"].tolist() == [4]
+    assert result["recipient_code"].tolist() == [12]
+    assert result["data_type_code"].tolist() == ["A"]
+
+
+def test_convert_unit_measure_to_amount_type_does_not_modify_input():
+    df = pd.DataFrame(
+        {
+            "unit_measure_code": ["XDC", "XDC", "USD", "USD"],
+            "unit_measure_name": ["Local", "Local", "US dollar", "US dollar"],
+            "amounttype_code": ["A", "D", "A", "A"],
+            "amount_type": ["Current", "Constant", "Current", "Current"],
+            "value": [1, 1, 2, 2],
+        }
+    )
+    original = df.copy()
+
+    result = convert_unit_measure_to_amount_type(df)
+
+    pd.testing.assert_frame_equal(df, original)
+    assert result.columns.tolist() == ["amounttype_code", "amount_type", "value"]
+    assert result["amounttype_code"].tolist() == ["XDC", "A"]
+    assert result["value"].tolist() == [1, 2]